@@ -1,4 +1,6 @@
+import os
 import re
+from pathlib import Path
 
 from intersphinx_registry import get_intersphinx_mapping
 
@@ -36,6 +38,12 @@ extensions = [
 intersphinx_mapping = get_intersphinx_mapping(
 packages={"python", "numpy", "scipy"}
 )
+# Prefer local copies of the inventories, see `tools/fetch_inventories.py`,
+# and only fall back to downloading them if they are missing.
+for name, (target, inventory) in intersphinx_mapping.items():
+    cached_inventory = Path(__file__).parent / '_intersphinx' / f'{name}.inv'
+    if cached_inventory.exists():
+        intersphinx_mapping[name] = (target, (str(cached_inventory), inventory))
 #intersphinx_disabled_reftypes = ["*"]
 
 templates_path = ['_templates']
@@ -106,7 +114,9 @@ autoapi_template_dir = "_templates/autoapi"
 autoapi_dirs = ["../src/openquad"]
 autoapi_root = "api/autoapi"
 autoapi_add_toctree_entry = False
-autoapi_keep_files = False
+# Keep the generated files between builds, such that unchanged API pages are
+# not read again by Sphinx (see `keep_unchanged_autoapi_files` below).
+autoapi_keep_files = True
 autoapi_member_order = "groupwise"
 autoapi_own_page_level = "class"
 autoapi_python_class_content = "class"
@@ -124,6 +134,24 @@ def skip_submodules(app, what, name, obj, skip, options):
         skip = True
     return skip
 
+# AutoAPI rewrites all of its files as soon as a single source file changed.
+# Restore the modification time of the files with unchanged content, so that
+# Sphinx only reads the API pages which actually changed.
+_autoapi_files = {}
+
+def snapshot_autoapi_files(app):
+    _autoapi_files.clear()
+    for path in (Path(app.srcdir) / autoapi_root).rglob("*.rst"):
+        _autoapi_files[path] = (path.read_bytes(), path.stat().st_mtime_ns)
+
+def keep_unchanged_autoapi_files(app):
+    for path, (content, mtime) in _autoapi_files.items():
+        if path.exists() and path.read_bytes() == content:
+            os.utime(path, ns=(mtime, mtime))
+
 # -----------------------------------------------------------------------------
 def setup(sphinx):
     sphinx.connect("autoapi-skip-member", skip_submodules)
+    # AutoAPI generates its files at "builder-inited" with default priority.
+    sphinx.connect("builder-inited", snapshot_autoapi_files, priority=100)
+    sphinx.connect("builder-inited", keep_unchanged_autoapi_files, priority=900)
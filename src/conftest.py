@@ -6,7 +6,10 @@ doctests without distracting import statements in the doctest.
 import pytest
 import numpy as np
 
+import openquad
 
-@pytest.ficture(autouse=True)
+
+@pytest.fixture(autouse=True)
 def set_doctest_env(doctest_namespace):
     doctest_namespace['np'] = np
+    doctest_namespace['openquad'] = openquad
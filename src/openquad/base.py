@@ -4,15 +4,59 @@
 
 from pathlib import Path
 from abc import ABC, abstractmethod
+from functools import lru_cache
 import numpy as np
 
 
-QUAD_DATA_DIR = (Path.cwd() / __file__).parent / 'data'
+QUAD_DATA_DIR = Path(__file__).resolve().parent / 'data'
 """Directory where quadrature grids are stored."""
 
 
+@lru_cache(maxsize=128)
+def _load_grid_file(filename):
+    """Load a quadrature grid stored in the `.npy` format.
+
+    The file is memory-mapped and the result is cached, such that repeated
+    initializations of the same quadrature method neither read nor copy the
+    data again.
+
+    Parameters
+    ----------
+    filename : str
+        Absolute path of the `.npy` file.
+
+    Returns
+    -------
+    data : ndarray
+        Read-only array with the content of the file.
+
+    """
+    data = np.load(filename, mmap_mode='r', allow_pickle=False,
+                   fix_imports=False)
+    return np.asarray(data)
+
+
 class AtomicQuadrature(ABC):
 
+    def __init_subclass__(cls, **kwargs):
+        """Tabulate the allowed sizes and degrees of the subclass.
+
+        If the subclass has the attributes `_available_sizes` or
+        `_available_degrees`, they are stored once for the whole class as
+        sets, such that checking a requested size or degree is a single
+        look-up instead of a comparison with every entry of the table.
+
+        """
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, '_available_sizes'):
+            cls._allowed_sizes = frozenset(
+                np.asarray(cls._available_sizes).tolist()
+            )
+        if hasattr(cls, '_available_degrees'):
+            cls._allowed_degrees = frozenset(
+                np.asarray(cls._available_degrees).tolist()
+            )
+
     @property
     @abstractmethod
     def dim(self):
@@ -43,12 +87,28 @@ class AtomicQuadrature(ABC):
             raise TypeError(f"`size` must be an integer, not {type(value)}")
         if value < 1:
             raise ValueError("`size` must be larger than zero")
-        if hasattr(self, "_available_sizes"):
-            if value not in self._available_sizes:
+        if hasattr(self, "_allowed_sizes"):
+            if value not in self._allowed_sizes:
                 msg = (f"`size` {value} not available. Possible values are:"
                        f"{self._available_sizes}")
                 raise ValueError(msg)
 
+    @property
+    def points(self):
+        """Sample points of the quadrature method.
+        For ``dim > 1``, the coordinates are stored in the first axis.
+        """
+        return self._points
+
+    @points.setter
+    def points(self, value):
+        self._points = value
+        # Arguments for evaluating callables on the sample points:
+        if self.dim == 1:
+            self._point_args = (value,)
+        else:
+            self._point_args = tuple(value)
+
     @property
     def degree(self):
         """Degree of exactness of the quadrature method.
@@ -69,8 +129,8 @@ class AtomicQuadrature(ABC):
     def _check_degree_allowed(self, value):
         if value is not None and value < 0:
             raise ValueError("`degree` must not be negative")
-        if hasattr(self, "_available_degrees"):
-            if value not in self._available_degrees:
+        if hasattr(self, "_allowed_degrees"):
+            if value not in self._allowed_degrees:
                 msg = (f"`degree` {value} not available. Possible values are:"
                        f"{self._available_degrees}")
                 raise ValueError(msg)
@@ -83,10 +143,11 @@ class AtomicQuadrature(ABC):
         x, w = self._points_weights(*pw_args, **pw_kwargs)
         if jacobian is not None:
             w = self._apply_jacobian(x, w, jacobian)
-        self.points = x
-        self.weights = w
-        #TODO: ensure that points are contiguous?
-        # Maybe necessary for reliable reshaping?
+        # The coordinates are stored in the first axis of the points, make sure
+        # that each of them is a contiguous row. This is a no-op for points
+        # which were already created with this layout.
+        self.points = np.ascontiguousarray(x)
+        self.weights = np.ascontiguousarray(w)
 
     @abstractmethod
     def _points_weights(self, **kwargs):
@@ -107,26 +168,29 @@ class AtomicQuadrature(ABC):
             filename = f"{type}_size{self.size}_degree{self.degree}{suffix}.npy"
         else:
             filename = f"{type}_size{self.size}{suffix}.npy"
-        data = np.load(QUAD_DATA_DIR / folder / filename,
-                       allow_pickle=False, fix_imports=False)
+        data = _load_grid_file(str(QUAD_DATA_DIR / folder / filename))
         if data.shape[0] not in [self.dim, self.dim+1]:
             raise TypeError(
                 f"Read data has wrong shape {data.shape} for dim {self.dim}"
             )
-        points = data[0:self.dim]
+        # The cached data is a read-only view of the mapped file. Copy the
+        # points, such that every instance owns writable points.
+        points = np.array(data[0:self.dim], order='C')
         if data.shape[0] == self.dim + 1:
-            weights = data[-1]
+            weights = np.ascontiguousarray(data[-1])
         else:
             weights = np.ones(self.size) / self.size
         return points, weights
 
     def _apply_jacobian(self, x, w, jacobian):
-        if self.dim == 1: x = np.expand_dims(x, 0)
-        try:
-            w = w * jacobian(*x)
-        except:
-            raise TypeError("Cannot apply jacobian")
-        return w
+        if not callable(jacobian):
+            raise TypeError(
+                f"`jacobian` must be a callable, not {type(jacobian)}"
+            )
+        if self.dim == 1:
+            return w * jacobian(x)
+        else:
+            return w * jacobian(*x)
 
     def integrate(self, f, f_kwargs={}, axis=-1):
         """Integrate `f`.
@@ -134,10 +198,7 @@ class AtomicQuadrature(ABC):
         `f` can be a callable, in which case `f(*points, **f_kwargs)` is integrated.
         """
         if callable(f):
-            if self.dim == 1:
-                f_samples = f(self.points, **f_kwargs)
-            else:
-                f_samples = f(*self.points, **f_kwargs)
+            f_samples = f(*self._point_args, **f_kwargs)
         else:
             f_samples = f
         return self._integrate_sample(f_samples, axis=axis)
@@ -149,8 +210,11 @@ class AtomicQuadrature(ABC):
         corresponding weights.
         Subclasses may overwrite this method, if necessary.
         """
-        f_samples = np.moveaxis(f_samples, axis, -1)
-        return np.sum(f_samples * self.weights, axis=-1)
+        if axis != -1:
+            f_samples = np.moveaxis(f_samples, axis, -1)
+        # Contract the last axis with the weights directly instead of
+        # creating the temporary array `f_samples * self.weights` first:
+        return np.matmul(f_samples, self.weights)
 
 
 class QuadratureWithoutDegree(AtomicQuadrature):
@@ -183,6 +247,31 @@ class QuadratureWithFixedDegree(AtomicQuadrature):
 
 class QuadratureWithDegree(AtomicQuadrature):
 
+    def __init_subclass__(cls, **kwargs):
+        """Tabulate the relation between sizes and degrees of the subclass.
+
+        If the subclass has the attributes `_available_sizes` and
+        `_available_degrees`, look-up tables for `_get_size` and `_get_degree`
+        are created once for the whole class.
+
+        """
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, '_available_sizes'):
+            sizes_by_degree = {}
+            degrees_by_size = {}
+            for size, degree in zip(cls._available_sizes.tolist(),
+                                    cls._available_degrees.tolist()):
+                # smallest size for a given degree
+                sizes_by_degree[degree] = min(
+                    size, sizes_by_degree.get(degree, size)
+                )
+                # largest degree for a given size
+                degrees_by_size[size] = max(
+                    degree, degrees_by_size.get(size, degree)
+                )
+            cls._sizes_by_degree = sizes_by_degree
+            cls._degrees_by_size = degrees_by_size
+
     def __init__(self, *args, size=None, degree=None, **kwargs):
         if size is not None and degree is None:
             self.size = size
@@ -203,9 +292,8 @@ class QuadratureWithDegree(AtomicQuadrature):
         overwritten in the corresponding child class.
 
         """
-        if hasattr(self, '_available_sizes'):
-            selection = np.nonzero(self._available_degrees == degree)
-            return self._available_sizes[selection].min()
+        if hasattr(self, '_sizes_by_degree'):
+            return self._sizes_by_degree[degree]
         else:
             msg = "f{self.__class__} missing method _get_size"
             raise NotImplementedError(msg)
@@ -219,9 +307,8 @@ class QuadratureWithDegree(AtomicQuadrature):
         be overwritten in the corresponding child class.
 
         """
-        if hasattr(self, '_available_degrees'):
-            selection = np.nonzero(self._available_sizes == size)
-            return self._available_degrees[selection].max()
+        if hasattr(self, '_degrees_by_size'):
+            return self._degrees_by_size[size]
         else:
             msg = f"{self.__class__} missing method _get_degree"
             raise NotImplementedError(msg)
@@ -245,8 +332,13 @@ class AtomicR1Quadrature(AtomicQuadrature):
         self._periodic = periodic
         super().__init__(*args, a=a, b=b, **kwargs)
         if self._periodic and self._has_endpoints: # drop endpoint
-            self.weights[0] += self.weights[-1]
-            self.weights = self.weights[:-1]
+            # Build new weights instead of modifying them in place, since
+            # the original array may be shared.
+            w = self.weights
+            weights = np.empty(w.size - 1, dtype=w.dtype)
+            weights[0] = w[0] + w[-1]
+            weights[1:] = w[1:-1]
+            self.weights = weights
             self.points = self.points[:-1]
 
 
@@ -257,7 +349,8 @@ class AtomicS2Quadrature(AtomicQuadrature):
     def __init__(self, *args, swap_angles=False, **kwargs):
         super().__init__(*args, **kwargs)
         if swap_angles:
-            self.points = np.stack((self.points[1], self.points[0]))
+            # reversed view, the points themselves are not copied
+            self.points = self.points[::-1]
             self._swapped_angles = True
         else:
             self._swapped_angles = False
@@ -299,9 +392,15 @@ class NoQuadrature(ABC):
         """Dummy integration routine that does not perform integration.
 
         `f` can be a callable, in which case `f(points, **f_kwargs)` is evaluated.
+        Otherwise, `f` is returned as an array without copying it.
+
+        The argument `axis` is accepted for compatibility with the other
+        quadrature methods, but it is ignored: The axes of the samples are
+        never reordered, since :meth:`GeometryQuadrature.integrate` relies on
+        the non-integrated axis staying in place.
         """
         if callable(f):
             f_samples = f(self.points, **f_kwargs)
         else:
             f_samples = f
-        return f_samples
+        return np.asarray(f_samples)
@@ -2,13 +2,29 @@
 # SPDX-FileCopyrightText: 2024  Alexander Blech
 # SPDX-License-Identifier: MPL-2.0
 
-from functools import lru_cache
+import math
+
 import numpy as np
 
 from .base import (AtomicSO3Quadrature, AtomicS2Quadrature, QuadratureWithoutDegree)
 
 
-@lru_cache(maxsize=100)
+def _fibonacci_series(n):
+    """Return the first `n` members of the Fibonacci series as a tuple."""
+    series = []
+    a, b = 0, 1
+    for _ in range(n):
+        series.append(a)
+        a, b = b, a + b
+    return tuple(series)
+
+
+_FIBONACCI_SERIES = _fibonacci_series(100)
+
+# Twice the golden ratio, evaluated once with plain floats
+_TWO_GOLDEN_RATIO = 1 + math.sqrt(5)
+
+
 def fibonacci(i):
     """Return the `i`th member of the Fibonacci series.
 
@@ -25,10 +41,13 @@ def fibonacci(i):
     """
     if i < 0:
         raise ValueError("Index i must not be negative")
-    elif i < 2:
-        return i
+    elif i < len(_FIBONACCI_SERIES):
+        return _FIBONACCI_SERIES[i]
     else:
-        return fibonacci(i-1) + fibonacci(i-2)
+        a, b = _FIBONACCI_SERIES[-2:]
+        for _ in range(i - len(_FIBONACCI_SERIES) + 1):
+            a, b = b, a + b
+        return b
 
 
 def _get_available_sizes_for_ZCW2(max_size):
@@ -40,15 +59,15 @@ def _get_available_sizes_for_ZCW2(max_size):
     [1]: M. Eden, M.H. Levitt, J. Magn. Reson. 132, 220-239 (1998).
 
     """
-    available_sizes = []
     M_offset = 6
-    M = -1
-    current_size = -1
-    while max_size > current_size:
-        M += 1
-        current_size = fibonacci(M_offset+M+2)
-        available_sizes.append(current_size)
-    return np.asarray(available_sizes)
+    # The Fibonacci series is increasing, so the sizes are sorted by
+    # construction, which is what `ZCW2._get_M` relies on.
+    available_sizes = []
+    for size in _FIBONACCI_SERIES[M_offset+2:]:
+        available_sizes.append(size)
+        if size >= max_size:
+            break
+    return np.asarray(available_sizes, dtype=np.int64)
 
 
 class FibonacciSphere(AtomicS2Quadrature, QuadratureWithoutDegree):
@@ -72,11 +91,20 @@ class FibonacciSphere(AtomicS2Quadrature, QuadratureWithoutDegree):
 
         """
         N = self.size
-        j = np.arange(self.size)
-        theta = np.arccos(1 - (2*j + 1) / N)
-        phi = (4*np.pi * j / (1+np.sqrt(5))) % (2*np.pi)
-        points = np.stack((theta, phi), axis=0)
-        weights = np.ones(self.size) / self.size * (4*np.pi)
+        j = np.arange(N, dtype=float)
+        points = np.empty((2, N))
+        theta, phi = points
+        # theta = arccos(1 - (2*j + 1) / N)
+        np.multiply(j, 2, out=theta)
+        np.add(theta, 1, out=theta)
+        np.divide(theta, N, out=theta)
+        np.subtract(1, theta, out=theta)
+        np.arccos(theta, out=theta)
+        # phi = (4*pi * j / (1+sqrt(5))) % (2*pi)
+        np.multiply(j, 4*np.pi, out=phi)
+        np.divide(phi, _TWO_GOLDEN_RATIO, out=phi)
+        np.mod(phi, 2*np.pi, out=phi)
+        weights = np.full(N, 4*np.pi / N)
         return points, weights
 
 
@@ -104,11 +132,22 @@ class ZCW2(AtomicS2Quadrature, QuadratureWithoutDegree):
         N = self.size
         M = self._get_M(N)
         g_M = fibonacci(M + M_offset)
-        j = np.arange(self.size)
-        theta = np.arccos(c[0] * (c[1] * np.mod(j/N, 1) - 1))
-        phi = 2*np.pi / c[2] * np.mod(j*g_M/N, 1)
-        points = np.stack((theta, phi), axis=0)
-        weights = np.ones(self.size) / self.size * (4*np.pi)
+        j = np.arange(N, dtype=float)
+        points = np.empty((2, N))
+        theta, phi = points
+        # theta = arccos(c[0] * (c[1] * mod(j/N, 1) - 1))
+        np.divide(j, N, out=theta)
+        np.mod(theta, 1, out=theta)
+        np.multiply(theta, c[1], out=theta)
+        np.subtract(theta, 1, out=theta)
+        np.multiply(theta, c[0], out=theta)
+        np.arccos(theta, out=theta)
+        # phi = 2*pi / c[2] * mod(j*g_M/N, 1)
+        np.multiply(j, g_M, out=phi)
+        np.divide(phi, N, out=phi)
+        np.mod(phi, 1, out=phi)
+        np.multiply(phi, 2*np.pi / c[2], out=phi)
+        weights = np.full(N, 4*np.pi / N)
         return points, weights
 
     def _get_M(self, N):
@@ -117,11 +156,10 @@ class ZCW2(AtomicS2Quadrature, QuadratureWithoutDegree):
         number of sampling points :math:`N`. See Eq. (59) in
         M. Eden, M.H. Levitt, J. Magn. Reson. 132, 220-239 (1998).
         """
-        M_offset = 6
-        M = 0
-        while fibonacci(M + 2 + M_offset) < N:
-            M += 1
-        assert fibonacci(M + 2 + M_offset) == N, "Something went wrong..."
+        # The available sizes are sorted and the `M`th entry corresponds to
+        # the Fibonacci number with index `M + 2 + M_offset`:
+        M = int(np.searchsorted(self._available_sizes, N))
+        assert self._available_sizes[M] == N, "Something went wrong..."
         return M
 
 
@@ -2,12 +2,93 @@
 # SPDX-FileCopyrightText: 2024  Alexander Blech
 # SPDX-License-Identifier: MPL-2.0
 
+from functools import lru_cache
 import numpy as np
 from scipy import special
 
 from .base import AtomicR1Quadrature, QuadratureWithDegree
 
 
+def _legendre_recurrence(n, x):
+    """Evaluate the Legendre polynomials of degree `n-1` and `n` at `x`.
+
+    Uses Bonnet's recurrence relation. Requires ``n >= 1``.
+    """
+    P_prev, P = np.ones_like(x), x
+    for k in range(2, n+1):
+        P_prev, P = P, ((2*k - 1) * x * P - (k - 1) * P_prev) / k
+    return P_prev, P
+
+
+@lru_cache(maxsize=256)
+def _gauss_legendre(N):
+    """Gauss-Legendre nodes and weights on the interval [-1, 1].
+
+    The results are cached and returned as read-only arrays.
+    """
+    x, w = special.roots_legendre(N)
+    x.flags.writeable = False
+    w.flags.writeable = False
+    return x, w
+
+
+@lru_cache(maxsize=256)
+def _gauss_lobatto_legendre(N, tol=1e-15, maxiter=100):
+    """Gauss-Lobatto-Legendre nodes and weights on the interval [-1, 1].
+
+    The inner nodes are the roots of :math:`P'_{N-1}`. They are determined
+    simultaneously with Newton's method starting from the
+    Chebyshev-Gauss-Lobatto nodes, which avoids solving the eigenvalue problem
+    of the companion matrix.
+
+    Parameters
+    ----------
+    N : int
+        Number of nodes, including the endpoints. Must be at least two.
+    tol : float, optional
+        Convergence threshold for the Newton steps.
+    maxiter : int, optional
+        Maximum number of Newton iterations.
+
+    Returns
+    -------
+    x : ndarray
+        Nodes in ascending order. Read-only, since the results are cached.
+    w : ndarray
+        Weights. Read-only, since the results are cached.
+
+    """
+    n = N - 1
+    x = -np.cos(np.pi * np.arange(N) / n)
+    for _ in range(maxiter):
+        P_prev, P = _legendre_recurrence(n, x)
+        # Newton step for (1 - x^2) P'_n(x), which vanishes at all nodes;
+        # the endpoints are fixed points of this iteration.
+        dx = (x * P - P_prev) / (N * P)
+        x = x - dx
+        if np.abs(dx).max() < tol:
+            break
+    P_prev, P = _legendre_recurrence(n, x)
+    w = 2 / (n * N * P**2)
+    x.flags.writeable = False
+    w.flags.writeable = False
+    return x, w
+
+
+def _transform_interval(x, w, a, b):
+    """Map nodes `x` and weights `w` from the interval [-1, 1] to [a, b].
+
+    New arrays are returned, so the cached nodes and weights stay untouched.
+    The nodes are transformed in place after the first multiplication, which
+    avoids a temporary array.
+
+    """
+    points = np.multiply(x, (b-a)/2)
+    points += (a+b)/2
+    weights = np.multiply(w, (b-a)/2)
+    return points, weights
+
+
 class GaussLegendre(AtomicR1Quadrature, QuadratureWithDegree):
 
     _has_endpoints = False
@@ -45,8 +126,8 @@ class GaussLegendre(AtomicR1Quadrature, QuadratureWithDegree):
             Quadrature weights.
     
         """
-        x, w = special.roots_legendre(self.size)
-        return (b-a)/2 * x + (a+b)/2, w * (b-a)/2
+        x, w = _gauss_legendre(self.size)
+        return _transform_interval(x, w, a, b)
 
 
 class GaussLobattoLegendre(AtomicR1Quadrature, QuadratureWithDegree):
@@ -95,9 +176,5 @@ class GaussLobattoLegendre(AtomicR1Quadrature, QuadratureWithDegree):
         if N < 2:
             msg = ("Gauss-Lobatto rule requires at least two sample points")
             raise ValueError(msg)
-        coeffs = np.append(np.zeros(N-1), 1)
-        x = np.concatenate(([-1.0],
-                            np.polynomial.legendre.Legendre(coeffs).deriv().roots(),
-                            [1.0]))
-        w = 2 / (N*(N-1) * special.eval_legendre(N-1, x)**2)
-        return (b-a)/2 * x + (a+b)/2, w * (b-a)/2
+        x, w = _gauss_lobatto_legendre(N)
+        return _transform_interval(x, w, a, b)
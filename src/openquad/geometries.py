@@ -9,12 +9,12 @@ This module aims for usability and flexibility...
 
 """
 from abc import ABC, abstractmethod
-from copy import deepcopy
+import math
 import numpy as np
 
 import quaternionic
 
-from .base import NoQuadrature
+from .base import AtomicQuadrature, NoQuadrature
 from .grid import xyz_from_angles, S2Grid, SO3Grid
 from .newton_cotes import CompositeTrapezoid, CompositeSimpson, Romberg
 from .gauss import GaussLegendre, GaussLobattoLegendre
@@ -94,6 +94,12 @@ class GeometryQuadrature(ABC):
         'so3-chebyshev-womersley': 'so3-chebyshev-womersley',
         'so3-covering-zcw': 'so3-covering-zcw',
     }
+    _periodic_dims = frozenset()
+    """frozenset: Dimensions of 1d methods which use periodic boundaries."""
+    _swap_angles_dims = frozenset()
+    """frozenset: Dimensions of 2d methods with swapped angle ordering."""
+    _polar_dims = frozenset()
+    """frozenset: Dimensions of 1d methods for the polar angle."""
 
     @property
     @abstractmethod
@@ -101,6 +107,25 @@ class GeometryQuadrature(ABC):
         """int : Dimension of this geometry."""
         pass
 
+    def __init_subclass__(cls, **kwargs):
+        """Map all method aliases of the subclass to the quadrature classes.
+
+        The look-up table is created once for the whole class, such that
+        selecting a method is a single dictionary look-up. Aliases referring
+        to methods which are not available are rejected right away.
+
+        """
+        super().__init_subclass__(**kwargs)
+        unavailable = (
+            set(cls._method_aliases.values()) - set(cls._available_methods)
+        )
+        if unavailable:
+            raise ValueError(f"Aliases for unavailable methods: {unavailable}")
+        cls._method_objects = {
+            alias: cls._available_methods[method_name]
+            for alias, method_name in cls._method_aliases.items()
+        }
+
     def __init__(self, method_specs):
         self._method_points = []
         self._method_weights = []
@@ -118,7 +143,10 @@ class GeometryQuadrature(ABC):
         if len(method_specs) < 1:
             raise ValueError("Method speficication must not be empty")
         for i, method_spec in enumerate(method_specs):
-            method_str, options = deepcopy(method_spec)
+            method_str, options = method_spec
+            # The options are completed later on, so work on a shallow copy
+            # of them, which leaves the user's dictionary unchanged.
+            options = dict(options)
             method_objects.append(self._select_method_object(method_str))
             method_options.append(options)
         self._check_method_objects(method_objects)
@@ -129,25 +157,25 @@ class GeometryQuadrature(ABC):
         self._construct_weights_and_meshgrids()
         self.shape = tuple(self._sizes)
         self.size = self._weights.size
-
-    def _resolve_method_name(self, method_str):
-        """Map the given `method_str` to the full method name."""
-        if method_str.lower() in self._method_aliases:
-            method_name = self._method_aliases[method_str.lower()]
-        else:
-            raise ValueError(f"Invalid method name: {method_str}")
-        return method_name
+        # If all methods integrate by a weighted sum over their samples, the
+        # integration over all dimensions is a single weighted sum with the
+        # combined weights.
+        self._is_weighted_sum = all(
+            isinstance(method, AtomicQuadrature)
+            and type(method)._integrate_sample
+                is AtomicQuadrature._integrate_sample
+            for method in self._methods
+        )
 
     def _select_method_object(self, method_str):
-        method_name = self._resolve_method_name(method_str)
-        if method_name in self._available_methods:
-            method_object = self._available_methods[method_name]
-        else:
-            raise ValueError(f"Method not available: {method_name}")
+        """Map the given `method_str` to the quadrature method class."""
+        method_object = self._method_objects.get(method_str.lower())
+        if method_object is None:
+            raise ValueError(f"Invalid method name: {method_str}")
         return method_object
 
     def _check_method_objects(self, method_objects):
-        total_dim = np.sum([method.dim for method in method_objects])
+        total_dim = sum(method.dim for method in method_objects)
         if total_dim != self.dim:
             raise ValueError("Invalid combination of methods")
 
@@ -158,17 +186,28 @@ class GeometryQuadrature(ABC):
 
             # figure out, on which dimensions the current method is acting:
             self._dims.append(tuple(
-                np.arange(method_object.dim) + collected_dims
+                range(collected_dims, collected_dims + method_object.dim)
             ))
             collected_dims += method_object.dim
 
             # fill remaining options
             options = self._check_and_fill_options(options, self._dims[-1])
             method = method_object(**options)
-            if method.points.ndim == 1:
-                self._method_points.append(np.expand_dims(method.points, 0))
+            points = method.points
+            if (self._dims[-1] in self._polar_dims
+                    and self._polar_sampling == 'cos'):
+                # The method samples the cosine of the polar angle. Transform
+                # its points back to the angle once, before building the grid,
+                # and reverse them such that the polar angles are in ascending
+                # order. The points and weights of the method are reversed
+                # alike, such that each node keeps its own weight:
+                points = np.arccos(points)[::-1]
+                method.points = method.points[::-1]
+                method.weights = method.weights[::-1]
+            if points.ndim == 1:
+                self._method_points.append(np.expand_dims(points, 0))
             else:
-                self._method_points.append(method.points)
+                self._method_points.append(points)
             self._method_weights.append(method.weights)
             self._methods.append(method)
             self._ndims.append(method.dim)
@@ -189,54 +228,49 @@ class GeometryQuadrature(ABC):
             elif key not in options and value != 'auto':
                 options[key] = value
         # use periodic boundaries if possible
-        if (
-            (isinstance(self, S2) and dims == (1,)) or
-            (isinstance(self, SO3) and dims in [(0,), (2,)])
-        ):
+        if dims in self._periodic_dims:
             options['periodic'] = True
         # determine ordering of angles for spherical quadrature schemes:
-        if self.dim == 3 and len(dims) == 2 and dims == (0, 1):
+        if dims in self._swap_angles_dims:
             options['swap_angles'] = True
             # assuming swap_angles=False by default in 2d quadrature classes
         return options
 
     def _construct_weights_and_meshgrids(self):
         """Construct combined quadrature weights and grid."""
-        self._weights = np.prod(
-            np.meshgrid(*self._method_weights, indexing='ij', copy=False),
-            axis=0,
-        ).flatten()
+        # Outer product of the weights of all methods. Multiplying them one
+        # after the other only allocates the partial products, instead of a
+        # full meshgrid for each method.
+        weights = self._method_weights[0]
+        for method_weights in self._method_weights[1:]:
+            weights = np.multiply.outer(weights, method_weights)
+        if len(self._method_weights) == 1:
+            # don't share the array with the quadrature method
+            self._weights = weights.copy()
+        else:
+            self._weights = weights.ravel()
         # For creating the quadrature meshgrid, I need to handle the cases
         # separately depending on the dimension of the subgrids:
         if self._ndims[0] == self.dim:
-            # the points form already the meshgrid
-            meshgrid = self._method_points[0]
-            # TODO: make sure it is contigous?
-            # TODO: could be merged with the case below?
-        elif np.all(np.asarray(self._ndims) == 1):
-            # If all subgrids have dimension one, it is easy:
-            meshgrid = np.meshgrid(*self._method_points, indexing='ij', copy=False),
-        elif self._ndims[0] == 1 and self._ndims[1] == 2:
-            # If some subgrids have more than one dimension, I need to build
-            # the meshgrid gradually:
-            p0, p1 = np.meshgrid(self._method_points[0][0], self._method_points[1][0],
-                                 indexing='ij', copy=False)
-            p0, p2 = np.meshgrid(self._method_points[0][0], self._method_points[1][1],
-                                 indexing='ij', copy=False)
-            meshgrid = np.stack((p0, p1, p2), axis=0)
-        elif self._ndims[0] == 2 and self._ndims[1] == 1:
-            p0, p2 = np.meshgrid(self._method_points[0][0], self._method_points[1][0],
-                                 indexing='ij', copy=False)
-            p1, p2 = np.meshgrid(self._method_points[0][1], self._method_points[1][0],
-                                 indexing='ij', copy=False)
-            meshgrid = np.stack((p0, p1, p2), axis=0)
+            # The points form already the grid. As for the weights, don't
+            # share the array with the quadrature method.
+            self._points = np.array(self._method_points[0], order='C')
         else:
-            raise ValueError("Error in constructing quadrature grid")
-        #TODO: is there a more elegant solution than the one above?
-        self._points = np.reshape(meshgrid, (self.dim, -1))
-        #TODO: do I need to set copy=True?
-        # This could be necessary to make sure that reshaping is reliable,
-        # independent from the data's memory layout
+            # Otherwise, each subgrid spans one axis of the meshgrid. Each of
+            # its coordinates is broadcast along all other axes and written
+            # once into its row of the preallocated points. Subgrids with
+            # more than one dimension contribute several coordinates along
+            # the same axis.
+            shape = tuple(p.shape[-1] for p in self._method_points)
+            self._points = np.empty((self.dim, math.prod(shape)),
+                                    dtype=np.result_type(*self._method_points))
+            i = 0
+            for axis, points in enumerate(self._method_points):
+                axis_shape = [-1 if j == axis else 1 for j in range(len(shape))]
+                for coordinate in points:
+                    row = self._points[i].reshape(shape)
+                    row[...] = np.reshape(coordinate, axis_shape)
+                    i += 1
 
     @abstractmethod
     def _get_interval(self, dims):
@@ -273,7 +307,7 @@ class GeometryQuadrature(ABC):
         jacobian = None
         return a, b, jacobian
 
-    def integrate(self, f, f_kwargs={}, axis=-1):#, dim=None):#, squeeze=True):#, order=None, only=None):
+    def integrate(self, f, f_kwargs={}, axis=-1, out=None):#, dim=None):#, squeeze=True):#, order=None, only=None):
         """Integrate the given data or callable.
 
         Parameters
@@ -290,11 +324,20 @@ class GeometryQuadrature(ABC):
 
             .. caution:: Experimental feature
 
+        out : ndarray, optional
+            Array in which the result is stored. It must have the shape of
+            the result. If all quadrature methods integrate by a weighted sum
+            of the samples, the result is written into `out` directly, such
+            that reusing the same array avoids allocating a new result.
+            Otherwise (e.g. for Romberg integration), the result is computed
+            as usual and copied into `out`.
+
         Returns
         -------
         result : scalar or ndarray
             The result of the integration. If the dimension of `f` equals the
             number of integration methods, the result is a scalar.
+            If `out` is given, `out` is returned.
 
         """
         if callable(f):
@@ -360,7 +403,13 @@ class GeometryQuadrature(ABC):
             method_index = list(range(len(self._methods)))
             axes = np.repeat(-1, len(self._methods))
 
-        f_array = np.moveaxis(f_array, axis, -1)
+        f_array = np.asanyarray(f_array)
+        if axis != -1:
+            f_array = np.moveaxis(f_array, axis, -1)
+        if self._is_weighted_sum:
+            # contract all dimensions at once instead of one method after
+            # the other
+            return np.matmul(f_array, self._weights, out=out)
         shape = f_array.shape[:-1]+self.shape
         result = f_array.reshape(shape)
         # iterate over angles/methods, starting with the last:
@@ -371,6 +420,9 @@ class GeometryQuadrature(ABC):
                 # No reduction has been performed. Hence, we need to skip this
                 # axis for the remaining iterations
                 axes = axes - 1
+        if out is not None:
+            out[...] = result
+            return out
         return result
 
     @abstractmethod
@@ -390,6 +442,32 @@ class GeometryQuadrature(ABC):
         """
         pass
 
+    def save(self, filename, weights=True):
+        """Save sampling points and weights to a binary file.
+
+        The points and weights are stored as rows of a single array in
+        the ``.npy`` format of the grids in :mod:`openquad.data`, which can
+        be read with :func:`numpy.load`. This function wraps
+        :func:`numpy.save`.
+
+        Parameters
+        ----------
+        filename : filename, file handle or pathlib.Path
+            Name of the binary file. The extension ``.npy`` is appended to
+            the file name if it does not already have one.
+        weights : logical, optional
+            If ``False``, only save sampling points and not the quadrature
+            weights.
+
+        """
+        points = np.reshape(self._points, (self.dim, -1))
+        n_rows = self.dim + 1 if weights else self.dim
+        rows = np.empty((n_rows, self.size))
+        rows[:self.dim] = points
+        if weights:
+            rows[-1] = self._weights
+        np.save(filename, rows)
+
 
 class SO3(GeometryQuadrature):
     r"""Group of all rotations in 3D space.
@@ -479,7 +557,7 @@ class SO3(GeometryQuadrature):
     :math:`\alpha` and :math:`\gamma`.  Gauss-Legendre quadrature is applied to
     the second coordinate, :math:`\beta`:
 
-    >>> openquad.SO3([
+    >>> quad = openquad.SO3([
     ...     ('trapezoid', dict(size=7)),
     ...     ('GaussLegendre', dict(degree=6)),
     ...     ('trapezoid', dict(size=7)),
@@ -491,7 +569,7 @@ class SO3(GeometryQuadrature):
     Euler angle, whereas the trapezoidal rule is applied to the third
     coordinate angle:
 
-    >>> openquad.SO3([
+    >>> quad = openquad.SO3([
     ...     ('S2-Gauss-LebedevLaikov', dict(degree=5)),
     ...     ('trapezoid', dict(size=6)),
     ... ])
@@ -499,15 +577,18 @@ class SO3(GeometryQuadrature):
     Instead, the :math:`\mathrm{S}^2` quadrature can be applied to the second
     and third angle:
 
-    >>> openquad.SO3([
-    ...     ('S2-Gauss-LebedevLaikov', dict(degree=5)),
+    >>> quad = openquad.SO3([
     ...     ('trapezoid', dict(size=6)),
+    ...     ('S2-Gauss-LebedevLaikov', dict(degree=5)),
     ... ])
 
     """
 
     dim = 3
     """int: Dimension of this geometry."""
+    _periodic_dims = frozenset({(0,), (2,)})
+    _swap_angles_dims = frozenset({(0, 1)})
+    _polar_dims = frozenset({(1,)})
 
     def __init__(self, method_specs, polar_sampling='cos'):
         _allowed_samplings = ['angle', 'cos']
@@ -517,16 +598,23 @@ class SO3(GeometryQuadrature):
             )
         self._polar_sampling = polar_sampling
         super().__init__(method_specs)
-        # in case we sample the polar integral in terms of cos(angle),
-        # transform the sample points back to the angle:
-        if self._polar_sampling == 'cos' and len(self._methods) > 2:
-            self._points[1] = (
-                np.flip(np.arccos(self._points[1]), axis=0)
-            )
         self.weights = self._weights
         self.points = self._points
         self.angles = self._points
-        self.quaternions = quaternionic.array.from_euler_angles(*self.angles)
+        self._quaternions = None
+
+    @property
+    def quaternions(self):
+        """Sampling points as unit quaternions, computed on first access."""
+        if self._quaternions is None:
+            self._quaternions = quaternionic.array.from_euler_angles(
+                *self.angles
+            )
+        return self._quaternions
+
+    @quaternions.setter
+    def quaternions(self, quaternions):
+        self._quaternions = quaternions
 
     def _get_interval(self, dims):
         """Determine the integration boundaries and the Jacobian."""
@@ -631,7 +719,7 @@ class S2(GeometryQuadrature):
     composite trapezoidal rule is applied to the second coordinate,
     :math:`\phi`:
 
-    >>> openquad.S2([
+    >>> quad = openquad.S2([
     ...     ('GaussLegendre', dict(degree=6)),
     ...     ('trapezoid', dict(size=7)),
     ... ])
@@ -639,12 +727,15 @@ class S2(GeometryQuadrature):
     A quadrature composed of a two-dimensional :math:`\mathrm{S}^2` Gauss
     quadrature:
 
-    >>> openquad.S2([
+    >>> quad = openquad.S2([
     ...     ('S2-Gauss-LebedevLaikov', dict(degree=5)),
     ... ])
 
     """
 
+    _periodic_dims = frozenset({(1,)})
+    _polar_dims = frozenset({(0,)})
+
     @property
     def dim(self):
         """int: Dimension of this geometry."""
@@ -658,16 +749,21 @@ class S2(GeometryQuadrature):
             )
         self._polar_sampling = polar_sampling
         super().__init__(method_specs)
-        # in case we sample the polar integral in terms of cos(angle),
-        # transform the sample points back to the angle:
-        if self._polar_sampling == 'cos' and len(self._methods) > 1:
-            self._points[0] = (
-                np.flip(np.arccos(self._points[0]), axis=0)
-            )
         self.weights = self._weights
         self.points = self._points
         self.angles = self._points
-        self.xyz = xyz_from_angles(self.angles, axis=0)
+        self._xyz = None
+
+    @property
+    def xyz(self):
+        """Sampling points in cartesian coordinates, computed on first access."""
+        if self._xyz is None:
+            self._xyz = xyz_from_angles(self.angles, axis=0)
+        return self._xyz
+
+    @xyz.setter
+    def xyz(self, xyz):
+        self._xyz = xyz
 
     def _get_interval(self, dims):
         """Determine the integration boundaries and the Jacobian."""
@@ -771,7 +867,7 @@ class Rn(GeometryQuadrature):
     --------
     Integraion over the one-dimensional interval :math:`[-1, 1]`:
 
-    >>> openquad.Rn([
+    >>> quad = openquad.Rn([
     ...     ('GaussLegendre', dict(degree=6, a=-1, b=1)),
     ... ])
 
@@ -779,29 +875,29 @@ class Rn(GeometryQuadrature):
     to the first coordinate, :math:`r_1`, and the composite trapezoidal rule to
     the second coordinate, :math:`r_2`:
 
-    >>> openquad.Rn([
+    >>> quad = openquad.Rn([
     ...     ('GaussLegendre', dict(degree=6, a=-10, b=10)),
     ...     ('trapezoid', dict(size=7, a=-1, b=1)),
     ... ])
 
     It is also possible, to define a Jacobian in terms of a python callable:
 
-    >>> openquad.Rn([
+    >>> quad = openquad.Rn([
     ...     ('GaussLegendre', dict(degree=6, a=0, b=np.pi, jacobian=np.sin)),
     ... ])
 
     which would be mathematically equivalent to the integral
 
-    >>> openquad.Rn([
+    >>> quad = openquad.Rn([
     ...     ('GaussLegendre', dict(degree=6, a=-1, b=1)),
     ... ])
 
     This allows to construct quadratures for arbitrary geometries, e.g. a 2D
     unit sphere:
 
-    >>> openquad.Rn([
+    >>> quad = openquad.Rn([
     ...     ('GaussLegendre', dict(degree=6, a=0, b=np.pi, jacobian=np.sin)),
-    ...     ('Trapezoid', dict(degree=6, a=0, b=2*np.pi, periodic=True)),
+    ...     ('Trapezoid', dict(size=7, a=0, b=2*np.pi, periodic=True)),
     ... ])
 
     """
@@ -31,9 +31,13 @@ def angles_from_xyz(xyz, axis=0):
     assert np.allclose(np.linalg.norm(xyz, axis=axis), 1.0)
     xyz = np.moveaxis(xyz, axis, 0)
     x, y, z = xyz
-    θ = np.arccos(z / 1.0)
-    ϕ = np.arctan2(y, x) % (2*np.pi)
-    return np.moveaxis([θ, ϕ], 0, axis)
+    # write the angles directly into the rows of the result
+    theta_phi = np.empty((2, *np.shape(z)), dtype=np.result_type(x, y, z, 1.0))
+    θ, ϕ = theta_phi[0, ...], theta_phi[1, ...]
+    np.arccos(z, out=θ)
+    np.arctan2(y, x, out=ϕ)
+    np.remainder(ϕ, 2*np.pi, out=ϕ)
+    return np.moveaxis(theta_phi, 0, axis)
 
 
 def xyz_from_angles(theta_phi, axis=0):
@@ -58,10 +62,16 @@ def xyz_from_angles(theta_phi, axis=0):
     """
     theta_phi = np.moveaxis(theta_phi, axis, 0)
     θ, ϕ = theta_phi
-    x = np.sin(θ) * np.cos(ϕ)
-    y = np.sin(θ) * np.sin(ϕ)
-    z = np.cos(θ)
-    return np.moveaxis([x, y, z], 0, axis)
+    # write the coordinates directly into the rows of the result
+    xyz = np.empty((3, *np.shape(θ)), dtype=np.result_type(θ, ϕ, 1.0))
+    x, y, z = xyz[0, ...], xyz[1, ...], xyz[2, ...]
+    sinθ = np.sin(θ)
+    np.cos(ϕ, out=x)
+    np.multiply(sinθ, x, out=x)
+    np.sin(ϕ, out=y)
+    np.multiply(sinθ, y, out=y)
+    np.cos(θ, out=z)
+    return np.moveaxis(xyz, 0, axis)
 
 
 def euler_angles_from_quaternions(quaternions, axis=0):
@@ -119,17 +129,35 @@ class Grid(ABC):
         header = None
         return data, header
 
-    # TODO: add writing a binary format
     def save(self, filename, representation, weights=None):
-        """TODO"""
+        """Save the grid points and optionally the weights to a text file.
+
+        The coordinates and the weights are written as columns of the file,
+        preceded by an index column.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            Name of the text file.
+        representation : str
+            Representation of the grid points.
+        weights : array_like, optional
+            Quadrature weights, which are stored after the coordinates.
+
+        """
         data, header = self._get_file_data_and_header(representation)
+        n_columns = len(data) if weights is None else len(data) + 1
         if weights is not None:
-            data = np.vstack((*data, weights))
             header = header + f"{'weights':>25}"
-        index = np.arange(1, data.shape[-1]+1)
-        fmt = '%10i' + data.shape[0] * '%25.16e'
-        np.savetxt(filename, np.vstack((index, *data)).T,
-                   fmt=fmt, header=header)
+        # fill the columns of the table directly instead of stacking and
+        # transposing copies of the data
+        table = np.empty((data.shape[-1], n_columns + 1))
+        table[:, 0] = np.arange(1, data.shape[-1]+1)
+        table[:, 1:len(data)+1] = data.T
+        if weights is not None:
+            table[:, -1] = weights
+        fmt = '%10i' + n_columns * '%25.16e'
+        np.savetxt(filename, table, fmt=fmt, header=header)
 
 
 class S2Grid(Grid):
@@ -154,17 +182,20 @@ class S2Grid(Grid):
         self.original_representation = representation
         self.original_shape = points.shape
         self.original_axis = axis
-        self.N = len(points)
         self._angles = None
         self._xyz = None
 
+        # Store each coordinate as a contiguous row. This copies the points
+        # only once here if they were stored along another axis, instead of
+        # in every conversion to another representation.
         points = np.moveaxis(points, axis, 0)
         if representation == 'angles':
-            self.angles = points.reshape(2, -1)
+            self.angles = np.ascontiguousarray(points.reshape(2, -1))
         elif representation == 'xyz':
-            self.xyz = points.reshape(3, -1)
+            self.xyz = np.ascontiguousarray(points.reshape(3, -1))
         else:
             raise ValueError(f"Unknown representation: {representation}")
+        self.N = points[0].size
 
     @property
     def angles(self):
@@ -232,8 +263,9 @@ class SO3Grid(Grid):
         self._angles = None
         self._quaternions = None
 
+        # store each Euler angle as a contiguous row
         if representation == 'Euler angles':
-            self.angles = points.reshape(3, -1)
+            self.angles = np.ascontiguousarray(points.reshape(3, -1))
         elif representation == 'quaternions':
             self.quaternions = points.reshape(-1, 4)
         else:
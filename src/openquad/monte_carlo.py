@@ -84,10 +84,18 @@ class MonteCarloS2(AtomicS2Quadrature, QuadratureWithoutDegree):
 
         """
         rng = np.random.default_rng(seed=seed)
-        phi = rng.uniform(0, 2*np.pi, n)
-        u = rng.uniform(-1, 1, n)
-        theta = np.arccos(u)
-        return np.array([theta, phi])
+        # Draw the angles directly into the rows of the output array.
+        # `low + (high-low)*random()` is what `rng.uniform` computes, so the
+        # samples are the same as for `rng.uniform(low, high, n)`.
+        angles = np.empty((2, n))
+        theta, phi = angles
+        rng.random(n, out=phi)
+        phi *= 2*np.pi
+        rng.random(n, out=theta) # u = 2*random() - 1
+        theta *= 2
+        theta -= 1
+        np.arccos(theta, out=theta)
+        return angles
 
 
 class MonteCarloSO3(AtomicSO3Quadrature, QuadratureWithoutDegree):
@@ -147,7 +155,8 @@ class MonteCarloSO3(AtomicSO3Quadrature, QuadratureWithoutDegree):
         """
         if method == 'quaternions':
             quaternions = self._sample_quaternions(n, seed)
-            x = quaternions.to_euler_angles.T
+            # transposed copy, such that each angle is a contiguous row
+            x = np.ascontiguousarray(quaternions.to_euler_angles.T)
         elif method == 'angles':
             x = self._sample_euler_angles(n, seed)
         else:
@@ -176,13 +185,22 @@ class MonteCarloSO3(AtomicSO3Quadrature, QuadratureWithoutDegree):
         """
         rng = np.random.default_rng(seed=seed)
         x = rng.random((3, n))
-        s1 = np.sin(2*np.pi*x[0])
-        s2 = np.sin(2*np.pi*x[1])
-        c1 = np.cos(2*np.pi*x[0])
-        c2 = np.cos(2*np.pi*x[1])
-        r1 = np.sqrt(1 - x[2])
+        # both angles and radii are computed only once
+        angles = np.multiply(2*np.pi, x[:2])
+        r1 = np.subtract(1, x[2])
+        np.sqrt(r1, out=r1)
         r2 = np.sqrt(x[2])
-        return quaternionic.array(np.transpose([c2*r2, s1*r1, c1*r1, s2*r2]))
+        # write the quaternion elements directly into contiguous rows
+        q = np.empty((4, n))
+        np.cos(angles[1], out=q[0])
+        q[0] *= r2
+        np.sin(angles[0], out=q[1])
+        q[1] *= r1
+        np.cos(angles[0], out=q[2])
+        q[2] *= r1
+        np.sin(angles[1], out=q[3])
+        q[3] *= r2
+        return quaternionic.array(q.T)
 
     def _sample_euler_angles(self, n, seed=None):
         """Generate uniform random 3d rotations in Euler angle representation.
@@ -203,11 +221,19 @@ class MonteCarloSO3(AtomicSO3Quadrature, QuadratureWithoutDegree):
 
         """
         rng = np.random.default_rng(seed=seed)
-        alpha = rng.uniform(0, 2*np.pi, n)
-        gamma = rng.uniform(0, 2*np.pi, n)
-        u = rng.uniform(-1, 1, n)
-        beta = np.arccos(u)
-        return np.array([alpha, beta, gamma])
+        # Draw the angles directly into the rows of the output array,
+        # see `MonteCarloS2._sample_spherical_polar_angles`.
+        angles = np.empty((3, n))
+        alpha, beta, gamma = angles
+        rng.random(n, out=alpha)
+        alpha *= 2*np.pi
+        rng.random(n, out=gamma)
+        gamma *= 2*np.pi
+        rng.random(n, out=beta) # u = 2*random() - 1
+        beta *= 2
+        beta -= 1
+        np.arccos(beta, out=beta)
+        return angles
 
     @staticmethod
     def random_rotation(seed=None):
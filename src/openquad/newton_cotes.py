@@ -51,9 +51,8 @@ class CompositeTrapezoid(AtomicR1Quadrature, QuadratureWithFixedDegree):
             msg = "Trapezoid method requires at least two sample points"
             raise ValueError(msg)
         x, dx = np.linspace(a, b, N, retstep=True)
-        w = np.zeros(N) + dx
-        w[0] = 0.5 * w[0]
-        w[-1] = 0.5 * w[-1]
+        w = np.full(N, dx)
+        w[0] = w[-1] = 0.5 * dx
         return x, w
 
 
@@ -94,10 +93,9 @@ class CompositeSimpson(AtomicR1Quadrature, QuadratureWithFixedDegree):
             msg = "Simpson method requires at least three sample points"
             raise ValueError(msg)
         x, dx = np.linspace(a, b, N, retstep=True)
-        i = np.arange(N)
-        w = np.zeros(N)
-        w[i % 2 == 0] = 2
-        w[i % 2 == 1] = 4
+        w = np.empty(N)
+        w[0::2] = 2
+        w[1::2] = 4
         w[0] = 1
         if N % 2 == 1:
             # Even number of subintervals: just do normal Simpson
@@ -111,7 +109,8 @@ class CompositeSimpson(AtomicR1Quadrature, QuadratureWithFixedDegree):
             w[-3] -= 1 / 4
             w[-2] += 2
             w[-1] = 5 / 4
-        w = w * dx / 3
+        w *= dx
+        w /= 3
         return x, w
 
 
@@ -154,18 +153,19 @@ class Romberg(AtomicR1Quadrature, QuadratureWithFixedDegree):
         # Check that we have a valid number of sample points
         N = self.size
         if self._periodic: N += 1
-        n = 1
-        while n < N - 1:
-            n <<= 1
-        if n != N - 1:
+        n = N - 1
+        if n < 1 or n & (n - 1):
             raise ValueError("Number of samples for Romberg integration"
                              "must be one plus a non-negative power of 2")
         x = np.linspace(a, b, N)
+        # step width for `romb`, which also covers the periodic endpoint
+        # that is not part of the points
+        self._dx = x[1] - x[0]
         w = np.ones(N)
         return x, w
 
     def _integrate_sample(self, f_samples, axis=-1):
-        dx = self.points[1] - self.points[0]
+        dx = self._dx
         f_samples = np.moveaxis(f_samples, axis, -1)
         if self._periodic: # add entry for endpoint of interval
             f_samples = np.concatenate((f_samples, f_samples[...,:1]),
@@ -5,6 +5,7 @@ import pytest
 from contextlib import nullcontext as does_not_raise
 
 from openquad import S2
+from openquad.newton_cotes import CompositeSimpson
 
 
 def f(theta, phi):
@@ -117,7 +118,8 @@ def test_fields_product_method():
     assert len(quad._method_points) == 2
     assert quad._method_points[0].shape == (1, n1)
     assert quad._method_points[1].shape == (1, n2)
-    assert np.all(quad._method_points[0] == x1)
+    # the polar method samples cos(theta), its points are stored as angles:
+    assert np.all(quad._method_points[0] == np.arccos(x1)[::-1])
 
     # test hidden properties
     assert quad._ndims == [1, 1]
@@ -205,3 +207,59 @@ def test_integration():
     assert quad.integrate(f) == pytest.approx(1)
     f_samples = f(*quad.angles)
     assert quad.integrate(f_samples) == pytest.approx(1)
+
+
+def test_integration_polar_weights():
+    """Test that the polar angles keep their weights for `polar_sampling='cos'`.
+
+    Composite Simpson with an even number of points has asymmetric weights.
+    """
+    quad = S2([
+        ('simpson', dict(size=10)),
+        ('trapezoid', dict(size=5)),
+    ], polar_sampling='cos')
+    simpson = CompositeSimpson(size=10, a=-1, b=1)
+    g = lambda x: x**3 + x
+    expected = 2*np.pi * simpson.integrate(g)
+    assert quad.integrate(lambda theta, phi: g(np.cos(theta))) == pytest.approx(expected)
+
+
+def test_polar_method_integration():
+    """Test that the polar method integrates like a standalone method."""
+    quad = S2([
+        ('simpson', dict(size=10)),
+        ('trapezoid', dict(size=5)),
+    ], polar_sampling='cos')
+    simpson = CompositeSimpson(size=10, a=-1, b=1)
+    g = lambda x: x**3 + x**2
+    assert quad._methods[0].integrate(g) == pytest.approx(simpson.integrate(g))
+
+
+def test_savetxt(tmp_path):
+    quad = S2([('lebedev', dict(degree=11))])
+    # text format: index column followed by the angles and the weights
+    quad.savetxt(tmp_path / 'grid.txt')
+    table = np.loadtxt(tmp_path / 'grid.txt')
+    assert table.shape == (quad.size, 4)
+    assert np.allclose(table[:, 1:3], quad.angles.T)
+    assert np.allclose(table[:, 3], quad.weights)
+
+
+def test_save(tmp_path):
+    quad = S2([('lebedev', dict(degree=11))])
+    # binary format: angles and weights as rows
+    quad.save(tmp_path / 'grid.npy')
+    rows = np.load(tmp_path / 'grid.npy')
+    assert np.array_equal(rows[:2], quad.angles)
+    assert np.array_equal(rows[2], quad.weights)
+    quad.save(tmp_path / 'points.npy', weights=False)
+    assert np.array_equal(np.load(tmp_path / 'points.npy'), quad.angles)
+
+
+def test_writeable_arrays():
+    # tabulated grids are cached read-only, but every instance owns its arrays
+    quad = S2([('lebedev', dict(degree=11))])
+    for array in (quad.points, quad.angles, quad.weights,
+                  quad._methods[0].points, quad._methods[0].weights):
+        assert array.flags.writeable
+    assert not np.shares_memory(quad.points, quad._methods[0].points)
@@ -1,5 +1,4 @@
 import numpy as np
-from scipy import integrate
 
 import spherical
 import quaternionic
@@ -17,10 +16,11 @@ def f_q(quaternions):
     """
     l_max = 2
     wigner = spherical.Wigner(l_max)
+    D = wigner.D(quaternions)
     poly = (
         1
-        + 1 * wigner.D(quaternions)[..., wigner.Dindex(2, 0, 0)]
-        + 1 * wigner.D(quaternions)[..., wigner.Dindex(2, 1, -2)]
+        + 1 * D[..., wigner.Dindex(2, 0, 0)]
+        + 1 * D[..., wigner.Dindex(2, 1, -2)]
     )
     if np.ndim(quaternions) > 1:
         assert poly.shape == (len(quaternions),)
@@ -58,8 +58,16 @@ def f_vector_q(quaternions):
 
 def test_test_function():
     """Make sure that the integral over the test function yields 1."""
-    assert integrate.tplquad(lambda a, b, g: np.sin(b)*f_abg(a, b, g).real, 0, 2*np.pi, 0, np.pi, 0, 2*np.pi)[0] == pytest.approx(1)
-    #assert integrate.tplquad(lambda a, b, g: np.sin(b)*f_abg(a, b, g).imag, 0, 2*np.pi, 0, np.pi, 0, 2*np.pi, epsabs=1e-1)[0] == pytest.approx(0)
+    # The test function only contains Wigner D-matrices up to l=2, which are
+    # integrated exactly by a small product rule: the trapezoid rule in the
+    # periodic angles alpha and gamma and Gauss-Legendre in cos(beta).
+    x, w_beta = np.polynomial.legendre.leggauss(6)
+    alpha = np.linspace(0, 2*np.pi, 6, endpoint=False)
+    a, b, g = np.meshgrid(alpha, np.arccos(x), alpha, indexing='ij')
+    f_samples = f_abg(a.ravel(), b.ravel(), g.ravel()).reshape(a.shape)
+    result = (2*np.pi/6)**2 * np.sum(w_beta[None, :, None] * f_samples)
+    assert result.real == pytest.approx(1)
+    assert result.imag == pytest.approx(0, abs=1e-14)
 
 
 def test_initialization():
@@ -204,12 +212,20 @@ def test_integration():
     assert quad.integrate(f_samples) == pytest.approx(1)
 
     quad = SO3([
-        ('so3-montecarlo', {'size':500, 'seed':0}),
+        ('so3-covering-karney', {'size':24}),
     ])
     assert quad.integrate(f_abg) == pytest.approx(1)
     f_samples = f_abg(*quad.angles)
     assert quad.integrate(f_samples) == pytest.approx(1)
 
+    # Monte Carlo integration only converges statistically
+    quad = SO3([
+        ('so3-montecarlo', {'size':500, 'seed':0}),
+    ])
+    assert quad.integrate(f_abg) == pytest.approx(1, abs=0.1)
+    f_samples = f_abg(*quad.angles)
+    assert quad.integrate(f_samples) == pytest.approx(1, abs=0.1)
+
 
 def test_integration_quaternions():
     """Test integration with quaternions."""
@@ -231,3 +247,29 @@ def test_integration_axis():
     result = quad.integrate(f_vector, axis=0)
     assert result.shape == (3, 3)
     assert result == pytest.approx(1)
+
+
+def test_integration_out():
+    """Test integration into a given output array."""
+    quad = SO3([
+        ('s2-gauss-lebedevlaikov', {'degree':7}),
+        ('trapezoid', {'size':11}),
+    ])
+    f_vector = f_vector_q(quad.quaternions)
+    out = np.empty((3, 3), dtype=f_vector.dtype)
+    result = quad.integrate(f_vector, axis=0, out=out)
+    assert result is out
+    assert out == pytest.approx(1)
+
+    # Romberg integration is not a weighted sum and takes the general path
+    quad = SO3([
+        ('trapezoid', {'size':8}),
+        ('romberg', {'size':17}),
+        ('trapezoid', {'size':8}),
+    ])
+    f_vector = f_vector_q(quad.quaternions)
+    out = np.empty((3, 3), dtype=f_vector.dtype)
+    result = quad.integrate(f_vector, axis=0, out=out)
+    assert result is out
+    assert np.array_equal(out, quad.integrate(f_vector, axis=0))
+    assert out == pytest.approx(1)
@@ -2,6 +2,11 @@ import pytest
 from contextlib import nullcontext as does_not_raise
 
 from openquad.geometries import GeometryQuadrature
+from openquad.lebedev import LebedevLaikov
+from openquad.graef import (
+    GraefS2Gauss, GraefS2Design, GraefSO3Gauss, GraefSO3Chebyshev
+)
+from openquad.womersley import WomersleyS2Design, WomersleySO3Chebyshev
 
 
 def test_all_method_aliases_are_valid():
@@ -10,3 +15,34 @@ def test_all_method_aliases_are_valid():
     method_names = GeometryQuadrature._available_methods
     for method in method_aliases.values():
         assert method in method_names.keys()
+
+
+def test_unavailable_method_alias_raises():
+    """Test that aliases for unavailable methods are rejected."""
+    with pytest.raises(ValueError):
+        class BrokenGeometry(GeometryQuadrature):
+            _method_aliases = {'missing': 'no-such-method'}
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        LebedevLaikov,
+        GraefS2Gauss,
+        GraefS2Design,
+        GraefSO3Gauss,
+        GraefSO3Chebyshev,
+        WomersleyS2Design,
+        WomersleySO3Chebyshev,
+    ]
+)
+def test_size_degree_lookup(method):
+    """Test that the tabulated sizes and degrees are resolved correctly."""
+    sizes = method._available_sizes
+    degrees = method._available_degrees
+    for degree in degrees:
+        assert method._sizes_by_degree[degree] == sizes[degrees == degree].min()
+    for size in sizes:
+        assert method._degrees_by_size[size] == degrees[sizes == size].max()
+    assert method._allowed_sizes == set(sizes.tolist())
+    assert method._allowed_degrees == set(degrees.tolist())
@@ -6,6 +6,7 @@ from contextlib import nullcontext as does_not_raise
 
 from openquad.newton_cotes import CompositeTrapezoid, CompositeSimpson, Romberg
 from openquad.gauss import GaussLegendre, GaussLobattoLegendre
+from openquad.base import NoQuadrature
 
 #@pytest.fixture()
 def f(x):
@@ -137,9 +138,9 @@ def test_poly_acc(method, tol):
         Pls = special.eval_legendre(orders, quad.points)
         results = quad.integrate(Pls, axis=-1)
         truevals = np.concatenate(([2], np.zeros(Pls.shape[0]-1)))
-        assert np.abs(results - truevals).max() == pytest.approx(0, abs=tol)
+        np.testing.assert_allclose(results, truevals, rtol=0, atol=tol)
 
-def none_type_quadrature():
+def test_none_type_quadrature():
     points = np.linspace(0, 1, 10)
     quad = NoQuadrature(points=points)
     assert quad.size == points.size
@@ -147,3 +148,8 @@ def none_type_quadrature():
 
     func = lambda x: x
     assert np.all(quad.integrate(func) == func(points))
+
+    # arrays are passed through without copy, independent of `axis`
+    samples = np.ones((3, points.size))
+    assert quad.integrate(samples) is samples
+    assert quad.integrate(samples, axis=0) is samples
@@ -123,18 +123,19 @@ def test_fields_and_integration(method, size, degree, kwargs):
 )
 def test_poly_acc(method, tol, kwargs):
     max_degree = 50
-    wigner = spherical.Wigner(max_degree)
     available_degree = method._available_degrees
     tested_degree = available_degree[available_degree <= max_degree]
     for degree in tested_degree:
+        # only evaluate the harmonics up to the tested degree
+        wigner = spherical.Wigner(degree)
         quad = method(degree=degree, **kwargs)
         # First, test that the weights are normalized:
         assert np.sum(quad.weights) == pytest.approx(4*np.pi)
         # Then, test the integration of all polynomials:
         q = quaternionic.array.from_spherical_coordinates(*quad.angles)
-        Ylm = wigner.sYlm(0, q)[:, :wigner.Yindex(degree, degree)+1]
+        Ylm = wigner.sYlm(0, q)
         results = quad.integrate(Ylm, axis=0)
         truevals = np.concatenate(
             ([np.sqrt(4*np.pi)], np.zeros(Ylm.shape[-1]-1))
         )
-        assert np.abs(results - truevals).max() == pytest.approx(0, abs=tol)
+        np.testing.assert_allclose(results, truevals, rtol=0, atol=tol)
@@ -0,0 +1,72 @@
+# OpenQuad - open database for multi-dimensional numerical integration
+# SPDX-FileCopyrightText: 2024  Alexander Blech
+# SPDX-License-Identifier: MPL-2.0
+
+"""Download the intersphinx inventories used by the documentation.
+
+The inventories are stored in ``doc/_intersphinx/<name>.inv``. If such a file
+exists, ``doc/conf.py`` uses it instead of fetching the inventory over the
+network during every build. Inventories that have already been downloaded are
+only fetched again with ``--refresh``.
+
+Usage::
+
+    python tools/fetch_inventories.py [--refresh]
+
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.request import urlopen
+
+from intersphinx_registry import get_intersphinx_mapping
+
+INTERSPHINX_PACKAGES = {"python", "numpy", "scipy"}
+"""set: Packages referenced by ``intersphinx_mapping`` in ``doc/conf.py``."""
+
+INVENTORY_DIR = Path(__file__).resolve().parent.parent / "doc" / "_intersphinx"
+"""Directory where the downloaded inventories are stored."""
+
+
+def fetch_inventory(url, filename):
+    """Download the inventory found at `url` and write it to `filename`."""
+    with urlopen(url, timeout=30) as response:
+        data = response.read()
+    filename.write_bytes(data)
+    return len(data)
+
+
+def main(refresh=False):
+    INVENTORY_DIR.mkdir(exist_ok=True)
+    mapping = get_intersphinx_mapping(packages=INTERSPHINX_PACKAGES)
+    jobs = []
+    for name, (target, inventory) in mapping.items():
+        filename = INVENTORY_DIR / f"{name}.inv"
+        if filename.exists() and not refresh:
+            continue
+        url = inventory if inventory is not None else target + "objects.inv"
+        jobs.append((name, url, filename))
+    # Fetch all inventories concurrently; the download is dominated by
+    # network latency and not by bandwidth. A failed download is not fatal,
+    # Sphinx then tries to fetch the inventory itself during the build.
+    with ThreadPoolExecutor(max_workers=max(len(jobs), 1)) as executor:
+        futures = {
+            name: executor.submit(fetch_inventory, url, filename)
+            for name, url, filename in jobs
+        }
+        for name, future in futures.items():
+            try:
+                nbytes = future.result()
+            except OSError as exc:
+                print(f"{name}: download failed ({exc})")
+            else:
+                print(f"{name}: {nbytes} bytes")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--refresh", action="store_true",
+        help="download inventories again, even if they already exist",
+    )
+    main(refresh=parser.parse_args().refresh)